@@ -33,7 +33,7 @@ DNSINIDir
       Functions: setDNSIniDir(path) (c path) and clearDNSIniDir() (C)
 
 When Natlink is enabled natlink.pyd is registered with
-      win32api.WinExec("regsvr32 /s pathToNatlinkPyd") (silent)
+      subprocess.run(["regsvr32", "/s", pathToNatlinkPyd]) (silent)
 
 It can be unregistered through function unregisterNatlinkPyd() see below.
 
@@ -49,46 +49,51 @@ More at the bottom, with the CLI description...
 """
 import os
 import os.path
+import re
+import functools
 import shutil
+import subprocess
 import sys
 import getopt
 import cmd
 import types
 # import pywintypes
-import traceback
 # import types
-import ctypes
+# ctypes and traceback are only needed on rare paths, they are imported where used
 
 from pathlib import WindowsPath
 
 import winreg
 import win32con
 
+# resolve these functions only once, at import time:
 try:
     from win32com.shell.shell import IsUserAnAdmin
-except:
+except ImportError:
+    import ctypes
     IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
-from win32com.shell import shell
 import win32api
  
 # from core directory, use registry entries from CURRENT_USER/Software/Natlink:
 from natlinkcore import natlinkstatus
+from natlinkcore.natlinkstatus import separatorDash, separatorEq
 from natlinkcore import natlinkcorefunctions
 
 # With python3, the core directory is directly in the root of natlinkcore (when installing natlink via pip)
 # and the ConfigureNatlink directory is a subdirectory of natlinkcore.
 from natlinkcore.__init__ import getNatlinkDirectory, getNatlinkUserDirectory
 
+# thisDir is the directory of this module, the core directory is one up.
+# This does not change during a session, so compute only once:
+_CORE_DIR = str(WindowsPath(__file__).parent.parent)
+
 def getCoreDirectory():
     """Returns the CoreDirectory, relative to thisDir
     
     thisDir is the directory of this (calling) module. 
     
     """
-    thisDir=WindowsPath(__file__).parent
-    # print(f"this dir {thisDir}")
-    _coreDir=str(thisDir.parent)
-    return _coreDir
+    return _CORE_DIR
 
 # def NatlinkStatusIniFileName():
 #     """
@@ -117,19 +122,20 @@ coreDir = getCoreDirectory()
 # except Exception as e:
 #     print(f"not loading pathqh, e {e}")
 # 
-try:
-    from win32ui import MessageBox
-    def windowsMessageBox(message, title="Natlink configure program"):
-        """do messagebox from windows, no wx needed
-        """
-        MessageBox(message, title)
-except:
-    MessageBoxA = ctypes.windll.user32.MessageBoxA
-    def windowsMessageBox(message, title="Natlink configure program"):
-        """do messagebox from windows, no wx needed
-        for old versions of python
-        """
-        MessageBoxA(None, message, title, 0)
+def windowsMessageBox(message, title="Natlink configure program"):
+    """do messagebox from windows, no wx needed
+
+    win32ui (MFC) is only imported when a message box is actually shown,
+    for old versions of python fall back to MessageBoxA
+    """
+    #pylint:disable=C0415
+    try:
+        from win32ui import MessageBox
+    except ImportError:
+        import ctypes
+        ctypes.windll.user32.MessageBoxA(None, message, title, 0)
+        return
+    MessageBox(message, title)
 
 if __name__ == '__main__':
     if sys.version[0] == '2':
@@ -139,6 +145,21 @@ if __name__ == '__main__':
         _mess = f"natlinkconfigfunctions for python{sys.version[:3]}"
         # windowsMessageBox(_mess)
 
+def scanFileNames(folder):
+    """return the (lowercase) names of the files in folder, as a set
+
+    one directory listing replaces a series of os.path.isfile calls.
+    If folder is empty or not a valid directory, an empty set is returned
+    (os.scandir would list the current directory for an empty folder).
+    """
+    if not folder:
+        return set()
+    try:
+        with os.scandir(folder) as entries:
+            return {e.name.lower() for e in entries if e.is_file()}
+    except OSError:
+        return set()
+
 class ElevationError(Exception):
     """exception at getting elevation
     """
@@ -157,6 +178,27 @@ class NatSpeakRunningError(Exception):
 
 ObsoleteStatusKeys = ('VocolaUsesSimpscrp', 'VocolaCommandFilesEditor', 'NatlinkDebug')
 
+# the language subfolders of the VocolaUserDirectory (3 letter language codes):
+VocolaLanguageFolders = frozenset(natlinkstatus.languages.values()) | {'enx'}
+
+# marks a cached value that has not been looked up yet:
+_NOT_CACHED = object()
+
+# the running python does not change during a session:
+_IS_64BIT_PYTHON = "64 bit" in sys.version
+_PYTHON_EXECUTABLE = sys.executable
+
+def _helpText(body):
+    """frame a help text between the separator lines, ready to be written at once
+    """
+    return '\n'.join((separatorDash, body, separatorEq)) + '\n'
+
+# text passed to the print functions, anything else is a list of lines:
+_STR_TYPES = (bytes, str)
+
+# an include line of Unimacro.vch or the old usc.vch, optional in the parent folder:
+_reUnimacroInclude = re.compile(r'^\s*include\s+(?:\.\.[\\/])?(?:Unimacro\.vch|usc\.vch)\s*;\s*$', re.IGNORECASE)
+
 #-----------------------------------------------------
 
 # import natlink  # to see if NatSpeak is running...
@@ -178,21 +220,28 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
         self.hadFatalErrors = False
         # self.DNSName = self.getDNSName()
         self.changesInInitPhase = 0
-        self.isElevated = IsUserAnAdmin()
+        # elevation does not change during a session, ask Windows only once:
+        try:
+            self.__class__.isElevated
+        except AttributeError:
+            self.__class__.isElevated = IsUserAnAdmin()
         self.checkedUrgent = None
+        # registry lookups, kept for the session, see getRegistryPythonPathKey:
+        self._regPythonPathKey = None
+        self._regNatlink = _NOT_CACHED
         natlinkstatus.NatlinkStatus.__init__(self, skipSpecialWarning=1, from_config=True)
 
     def checkCoreDirectory(self):
         """check if coreDir (from this file) and coreDirectory (from natlinkstatus) match, if not, raise error
         """
         _coreDir = getCoreDirectory()
-        coreDirSitePackes = self.findInSitePackages(_coreDir)
-        if coreDirSitePackes and coreDirSitePackes != _coreDir:
-            _coreDir = self.findInSitePackages(_coreDir)
+        coreDirSitePackages = self.findInSitePackages(_coreDir)
+        if coreDirSitePackages and coreDirSitePackages != _coreDir:
+            _coreDir = coreDirSitePackages
             print(f'Take current natlinkcore directory in site-packages: {_coreDir}')
         coreDir2 = self.getNatlinkDirectory()
         
-        if str(coreDir2).lower() != str(_coreDir).lower():
+        if os.path.normcase(coreDir2) != os.path.normcase(_coreDir):
             print('ambiguous core directory,\nfrom this module: %s\nfrom status in natlinkstatus: %s'%
                                               (_coreDir, coreDir2))
             
@@ -219,7 +268,7 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
         #pylint:disable=W0613, R0911, R0912
 
         self.checkedUrgent = 1
-        if sys.version.find("64 bit") >= 0:
+        if _IS_64BIT_PYTHON:
             print('=============================================') 
             print('You installed a 64 bit version of python.')
             print('Natlink cannot run with this version, please uninstall and')
@@ -227,9 +276,8 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
             print('=============================================')
             return None
 
-        if self.getDNSInstallDir() == -1:
-            return None
-        if self.getDNSIniDir() == -1:
+        # values are cached in NatlinkStatus, -1 if not found:
+        if -1 in (self.DNSInstallDir, self.DNSIniDir):
             return None
 
         ## unlikely case:
@@ -238,34 +286,40 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
         coreDir3 = self.findInSitePackages(CoreDir)
         ## coreDir is global variable, set at top
         
-        if str(CoreDir).lower() != coreDir3.lower():
+        if os.path.normcase(CoreDir) != os.path.normcase(coreDir3):
             self.fatal_error(f'Ambiguous core directory,\nfrom this module: "{coreDir3}\nfrom natlinkstatus.getNatlinkDirectory: "{CoreDir}"')
         # if coreDir.lower() != CoreDir.lower():
         #     self.fatal_error(f'Ambiguous core directory,\nfrom this module (global): "{coreDir}\nfrom natlinkstatus.getNatlinkDirectory: "{CoreDir}"')
             
+        # one directory listing for the core directory and one for the PYD subdirectory,
+        # instead of separate isfile calls (names lowercase, Windows is case insensitive):
+        coreFiles = scanFileNames(coreDir3)
+        pydFiles = scanFileNames(os.path.join(coreDir3, 'PYD'))
+
         currentPydPath = os.path.join(coreDir3, 'natlink.pyd')
         NatlinkPydOrigin = self.userinisection.get('NatlinkPydOrigin')
+        hasPydOrigin = bool(NatlinkPydOrigin and os.path.isfile(NatlinkPydOrigin))
  
         FirstInstall = False
-        if not (currentPydPath and os.path.isfile(currentPydPath)):
-            if NatlinkPydOrigin and os.path.isfile(NatlinkPydOrigin):
+        if 'natlink.pyd' not in coreFiles:
+            if hasPydOrigin:
                 print('no natlink.pyd, clear "NatlinkPydOrigin" setting')
                 # no current .pyd, clear NatlinkPydOrigin:
                 self.userinisection.delete('NatlinkPydOrigin')
             FirstInstall = True
         else:
-            if not (NatlinkPydOrigin and os.path.isfile(NatlinkPydOrigin)):
+            if not hasPydOrigin:
                 print('no valid "NatlinkPydOrigin" setting, remove natlink.pyd')
                 mess = '"NatlinkPydOrigin" setting not valid, natlink.pyd should be removed'
                 if not self.isElevated:
                     raise ElevationError(mess)
-                self.removeNatlinkPyd()
-                assert not os.path.isfile(currentPydPath)
+                if not self.removeNatlinkPyd():
+                    return None
                 FirstInstall = True
 
         wantedPyd = self.getWantedNatlinkPydFileName()       # wanted original based on python version and Dragon version
         wantedPydPath = os.path.join(coreDir3, 'PYD', wantedPyd)
-        if not os.path.isfile(wantedPydPath):
+        if wantedPyd.lower() not in pydFiles:
             self.fatal_error(f'natlinkconfigfunctions, configCheckNatlinkPydFile: Could not find wantedPydPath: {wantedPydPath}')
             return None
         targetPydPath = currentPydPath
@@ -274,9 +328,7 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
             # record the python used to run this command.  dragon/natlink.pyd will need to load
             # this particular python later.
 
-            python_executable = sys.executable
-
-            self.userinisection.set("NatlinkPythonExecutable",python_executable)
+            self.userinisection.set("NatlinkPythonExecutable", _PYTHON_EXECUTABLE)
 
             result = self.copyNatlinkPydPythonVersion(wantedPydPath, targetPydPath)
             if not result:
@@ -299,28 +351,29 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
         """remove the natlink.pyd file (Dragon should be switched off)
 
         in order to redo the copyNatlinkPydPythonVersion again
+
+        Returns 1 iff the file no longer exists on disk.
         """
         if not self.isElevated:
             raise ElevationError("needed for removing your previous natlink.pyd. Also close Dragon.")
         # if self.isNatSpeakRunning(): raise NatSpeakRunningError("needed for removing your previous natlink.pyd")
         _coreDir = self.getNatlinkDirectory()
-        currentPydFile = os.path.join(_coreDir, 'natlink.pyd')
-        if os.path.isfile(currentPydFile):
-            try:
-                os.remove(currentPydFile)
-            except (WindowsError, OSError):
-                messList = ['Cannot remove natlink.pyd from the core directory:',
-                            '',
-                            f'{_coreDir}',
-                        '', 
-                        'Probably Dragon is running.',
-                        'But if this error occurs while Dragon is NOT running,',
-                        'please try to remove "natlink.pyd" from the core directory (see above)',
-                        'and re-run this program']
-                self.fatal_error('\n'.join(messList))
-                return None
-        if os.path.isfile(currentPydFile):
-            self.fatal_error('strange, could not remove "natlink.pyd" from the core directory: "%s"Possibly Dragon is running'% _coreDir)
+        currentPydFile = self.natlinkPydPath
+        # just try, when os.remove succeeds, the file is gone:
+        try:
+            os.remove(currentPydFile)
+        except FileNotFoundError:
+            pass  # nothing to remove
+        except OSError:
+            messList = ['Cannot remove natlink.pyd from the core directory:',
+                        '',
+                        f'{_coreDir}',
+                    '', 
+                    'Probably Dragon is running.',
+                    'But if this error occurs while Dragon is NOT running,',
+                    'please try to remove "natlink.pyd" from the core directory (see above)',
+                    'and re-run this program']
+            self.fatal_error('\n'.join(messList))
             return None
         # ok:
         return 1  #
@@ -331,24 +384,26 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
             raise ElevationError("needed for copying the correct natlink.pyd file.")
         # if self.isNatSpeakRunning(): raise NatSpeakRunningError("needed for rcopying the correct natlink.pyd file")
 
+        # the existence check is needed for unregistering, os.remove itself is not checked again:
         if os.path.isfile(currentPydFile):
             self.unregisterNatlinkPyd()
             try:
                 os.remove(currentPydFile)
-            except WindowsError:
+            except FileNotFoundError:
+                pass
+            except OSError:
                 self.fatal_error('cannot remove currentPydFile "%s",\nProbably you must exit Dragon first\nPossibly restart your computer.'% currentPydFile)
                 return None
 
-        if os.path.isfile(wantedPydFile):
-            try:
-                shutil.copyfile(wantedPydFile, currentPydFile)
-                print('copied pyd (=dll) file %s to %s'% (wantedPydFile, currentPydFile))
-            except:
-                self.fatal_error("Could not copy %s to %s\nProbably you need to exit Dragon first."% (wantedPydFile, currentPydFile))
-                return None
-        else:
+        try:
+            shutil.copyfile(wantedPydFile, currentPydFile)
+        except FileNotFoundError:
             self.fatal_error("wantedPydFile %s is missing! Cannot copy to natlink.pyd/natlink.pyd"% wantedPydFile)
             return None
+        except:
+            self.fatal_error("Could not copy %s to %s\nProbably you need to exit Dragon first."% (wantedPydFile, currentPydFile))
+            return None
+        print('copied pyd (=dll) file %s to %s'% (wantedPydFile, currentPydFile))
         return 1
 
     def setRegistryPythonPathNatlink(self, flags=win32con.KEY_ALL_ACCESS, silent=None):
@@ -368,25 +423,25 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
 
         result = self.getRegistryPythonPathNatlink()
         if result:
-            natlink_key, natlinkdir_from_registry = result
+            _natlink_key, natlinkdir_from_registry = result
             if coreDir == natlinkdir_from_registry:
                 print(f'setRegistryPythonPathNatlink, coreDir already OK: {coreDir}')
                 return 1
-            result = winreg.DeleteKeyEx(pythonpath_key, "natlink", winreg.KEY_WOW64_32KEY | flags)
 
-        # Natlink section not exists (possibly just deleted)
-        _value, flags = ("Natlink", winreg.KEY_WOW64_32KEY | flags)
-        natlink_key = winreg.CreateKeyEx(pythonpath_key, "Natlink", 0, flags)
+        # open (or create) the Natlink key once, and set the value through this handle.
+        # no need to delete a wrong value first, SetValueEx overwrites it:
+        natlink_key = winreg.CreateKeyEx(pythonpath_key, "Natlink", 0, winreg.KEY_WOW64_32KEY | flags)
         if not natlink_key:
             print('setRegistryPythonPathNatlink, cannot create "Natlink" key in registy')
             return None
-
-        _value, flags = (coreDir, winreg.KEY_WOW64_32KEY | flags)
-        result = winreg.SetValueEx(natlink_key, "", 0, winreg.REG_SZ, coreDir)            
+        try:
+            winreg.SetValueEx(natlink_key, "", 0, winreg.REG_SZ, coreDir)
+        finally:
+            winreg.CloseKey(natlink_key)
+        # changed, read again when asked for:
+        self._regNatlink = _NOT_CACHED
         return True
 
-
-
     def clearRegistryPythonPathNatlink(self, flags=win32con.KEY_ALL_ACCESS, silent=None):
         """clear the registry setting in PythonPath to the coreDir .../Natlink/MacroSystem/Core
         
@@ -397,22 +452,50 @@ class NatlinkConfig(natlinkstatus.NatlinkStatus):
         if not pythonpath_key:
             return True
 
-        result = self.getRegistryPythonPathNatlink()
-        if result:
-            if not self.isElevated:
-                raise ElevationError("needed for deleting the registry key of the obsolete Natlink pythonpath variable")
-            # natlink_key, natlinkdir_from_registry = result # ????
-            result = winreg.DeleteKeyEx(pythonpath_key, "natlink", winreg.KEY_WOW64_32KEY | flags)
+        # delete straight away, a missing Natlink key is not an error:
+        try:
+            winreg.DeleteKeyEx(pythonpath_key, "natlink", winreg.KEY_WOW64_32KEY | flags)
+        except FileNotFoundError:
+            pass
+        except PermissionError as e:
+            raise ElevationError("needed for deleting the registry key of the obsolete Natlink pythonpath variable") from e
+        self._regNatlink = None
         return True
     
+    def getRegistryPythonPathKey(self, silent=True):
+        """returns the key to PythonPath setting in the registry
+
+        as in natlinkstatus, but the key is opened only once, and kept
+        until closeRegistryKeys is called
+        """
+        if self._regPythonPathKey is None:
+            self._regPythonPathKey = natlinkstatus.NatlinkStatus.getRegistryPythonPathKey(self, silent=silent)
+        return self._regPythonPathKey
+
+    def getRegistryPythonPathNatlink(self, flags=winreg.KEY_READ, silent=True):
+        """returns the path-to-core of Natlink and the PythonPath key in the registry
+
+        as in natlinkstatus, but the result is cached, until it is changed
+        by setRegistryPythonPathNatlink or clearRegistryPythonPathNatlink
+        """
+        if self._regNatlink is _NOT_CACHED:
+            self._regNatlink = natlinkstatus.NatlinkStatus.getRegistryPythonPathNatlink(self, flags=flags, silent=silent)
+        return self._regNatlink
+
+    def closeRegistryKeys(self):
+        """close the registry key that is kept open by getRegistryPythonPathKey
+        """
+        if self._regPythonPathKey:
+            winreg.CloseKey(self._regPythonPathKey)
+        self._regPythonPathKey = None
+        self._regNatlink = _NOT_CACHED
+
     def checkIniFiles(self):
         """check if INI files are consistent
         this is done through the
 
         """
-        if self.DNSInstallDir == -1:
-            return None
-        if self.DNSIniDir == -1:
+        if -1 in (self.DNSInstallDir, self.DNSIniDir):
             return None
 
         result = self.NatlinkIsEnabled(silent=1)
@@ -446,62 +529,45 @@ Natlink is now disabled.
 
     def warning(self,text):
         """is currently overloaded in GUI"""
-        if isinstance(text, str):
-            T = text
-        else:
-            # list probably:
-            T = '\n'.join(text)
-        print(('-'*60))
-        print(T)
-        print('')
-        print('Most often, you solve this by running the')
-        print('ConfigureNatlink program and Re-register natlink.pyd')
-        print('(Or run the Command Line Interface with option "r").')
-        print(f'start_configurenatlink or start_natlinkconfigfunctions in directory "{sys.prefix}\\Scripts".')
-        print(('='*60))
-        
-        
-        return T
+        footer = '\n'.join(['',
+                    'Most often, you solve this by running the',
+                    'ConfigureNatlink program and Re-register natlink.pyd',
+                    '(Or run the Command Line Interface with option "r").',
+                    f'start_configurenatlink or start_natlinkconfigfunctions in directory "{sys.prefix}\\Scripts".'])
+        return self._emit(text, footer=footer)
 
     def error(self,text):
         """is currently overloaded in GUI"""
-        #pylint:disable=R0201
-        if type(text) in (bytes, str):
-            T = text
-        else:
-            # list probably:
-            T = '\n'.join(text)
-        print(('-'*60))
-        print(T)
-        print(('='*60))
-        return T
-
+        return self._emit(text)
 
     def message(self, text):
         """prints message, can be overloaded in configureGUI
         """
-        #pylint:disable=R0201
-        if isinstance(text, str):
-            T = text
-        else:
-            # list probably:
-            T = '\n'.join(text)
-        print(('-'*60))
-        print(T)
-        print(('='*60))
+        self._emit(text)
 
     def setstatus(self, text):
         """prints status, should be overloaded in configureGUI
         """
-        #pylint:disable=R0201        
-        if isinstance(text, str):
+        self._emit(text)
+
+    def _emit(self, text, footer=None):
+        """print text (a string or a list of lines) between separator lines
+
+        footer is printed after the text, before the closing line.
+        returns the text, as a single string
+        """
+        #pylint:disable=R0201
+        if isinstance(text, _STR_TYPES):
             T = text
         else:
             # list probably:
             T = '\n'.join(text)
-        print(('-'*60))
+        print(separatorDash)
         print(T)
-        print(('='*60))
+        if footer:
+            print(footer)
+        print(separatorEq)
+        return T
 
     def isValidPath(self, Path, wantDirectory=None, wantFile=None):
         """return the path, if valid
@@ -511,15 +577,32 @@ Natlink is now disabled.
         #pylint:disable=R0201           
         return natlinkstatus.isValidPath(Path, wantDirectory=wantDirectory, wantFile=wantFile)
 
+    def _clearWithBackup(self, key, wantFile=None, invalidMessage=None):
+        """clear key in natlinkstatus.ini, keeping a valid previous value in "Old"+key
+
+        invalidMessage is printed if there was no valid previous value.
+        returns the previous value (empty if the key was not set)
+        """
+        oldvalue = self.userinisection.get(key)
+        if not oldvalue:
+            if invalidMessage:
+                print(invalidMessage)
+            return oldvalue
+        with self.userinisection.batch():
+            if self.isValidPath(oldvalue, wantFile=wantFile):
+                self.userinisection.set("Old"+key, oldvalue)
+            elif invalidMessage:
+                print(invalidMessage)
+            self.userinisection.delete(key)
+        return oldvalue
+
     def printInifileSettings(self):
         """utility function printing all ini file settings
         """
         print(('Settings in file "natlinkstatus.ini" in\ncore directory: "%s"\n'% self.getNatlinkDirectory()))
-        Keys = list(self.userinisection.keys())
-        Keys.sort()
-        for k in Keys:
-            print(("\t%  s:\t%s"% (k, self.userinisection.get(k))))
-        print(("-"*60))
+        for k in sorted(self.userinisection.keys()):
+            print(f"\t{k}:\t{self.userinisection.get(k)}")
+        print(separatorDash)
 
     def setDNSInstallDir(self, new_dir):
         """set in registry local_machine/natlink
@@ -528,9 +611,9 @@ Natlink is now disabled.
         """
         key = 'DNSInstallDir'
         checkDir = self.isValidPath(new_dir, wantDirectory=1)
-        while checkDir and (checkDir.lower().endswith("app") or checkDir.lower().endswith("program")):
+        while checkDir and os.path.basename(os.path.normcase(checkDir)) in ("app", "program"):
             print(('setDNSInstallDir, one directory too deep %s'% checkDir))
-            checkDir = os.path.join(os.path.normpath(os.path.join(checkDir, '..')))
+            checkDir = os.path.dirname(checkDir)
             print(('... and proceed with: %s'% checkDir))
         if not checkDir:
             mess = "setDNSInstallDir, not a valid directory: %s"% new_dir
@@ -538,9 +621,10 @@ Natlink is now disabled.
 
         if self.checkDNSProgramDir(checkDir):
             # print 'set DNS Install Directory to: %s'% new_dir
-            self.userinisection.delete("Old"+key)
-            self.userinisection.set(key, checkDir)
-            self.getDNSInstallDir(force=1)  ## new settings
+            with self.userinisection.batch():
+                self.userinisection.delete("Old"+key)
+                self.userinisection.set(key, checkDir)
+            self.refreshDNSInstallDir()  ## new settings
             return None
         mess =  f'setDNSInstallDir, directory "{checkDir}" is not a correct Dragon Program Directory'
         print(mess)
@@ -550,12 +634,8 @@ Natlink is now disabled.
         """clear in registry local_machine/natlink/natlinkcore
 
         """
-        key = 'DNSInstallDir'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
-        self.userinisection.delete(key)
-        self.getDNSInstallDir(force=1)  ## new settings
+        self._clearWithBackup('DNSInstallDir')
+        self.refreshDNSInstallDir()  ## new settings
 
 
 
@@ -564,38 +644,67 @@ Natlink is now disabled.
 
         """
         key = 'DNSIniDir'
-        if os.path.isdir(new_dir):
-            # check INI files:
-            nssystem = os.path.join(new_dir, self.NSSystemIni)
-            nsapps = os.path.join(new_dir, self.NSAppsIni)
-            if not os.path.isfile(nssystem):
-                mess = 'folder %s does not have the INI file %s'% (new_dir, self.NSSystemIni)
-                print(mess)
-                return mess
-            if not os.path.isfile(nsapps):
-                mess =  'folder %s does not have the INI file %s'% (new_dir, self.NSAppsIni)
+        # one directory listing checks the directory and both INI files
+        # (not for an empty new_dir, os.scandir would list the current directory):
+        names = None
+        if new_dir:
+            try:
+                with os.scandir(new_dir) as entries:
+                    names = {e.name.lower() for e in entries if e.is_file()}
+            except OSError:
+                pass
+        if names is None:
+            mess = "setDNSIniDir, not a valid directory: %s"% new_dir
+            print(mess)
+            return mess  # signify an error...
+        for iniFile in (self.NSSystemIni, self.NSAppsIni):
+            if iniFile.lower() not in names:
+                mess = 'folder %s does not have the INI file %s'% (new_dir, iniFile)
                 print(mess)
                 return mess
+        with self.userinisection.batch():
             self.userinisection.set(key, new_dir)
             self.userinisection.delete("Old"+key)
-            self.getDNSIniDir(force=1)
-            return  None # OK
-        # else:
-        mess = "setDNSIniDir, not a valid directory: %s"% new_dir
-        print(mess)
-        return mess  # signify an error...
+        self.refreshDNSIniDir()
+        return  None # OK
 
 
     def clearDNSIniDir(self):
         """clear in registry local_machine/natlink/
 
         """
-        key = 'DNSIniDir'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
-        self.userinisection.delete(key)
-        self.getDNSIniDir(force=1)
+        self._clearWithBackup('DNSIniDir')
+        self.refreshDNSIniDir()
+
+    def refreshDNSInstallDir(self):
+        """get DNSInstallDir again, and update the value cached in NatlinkStatus
+        
+        -1 if not found, as in NatlinkStatus.__init__.
+        DNSVersion and DNSName follow from DNSInstallDir, so are refreshed too.
+        """
+        try:
+            result = self.getDNSInstallDir(force=1)
+        except OSError:
+            result = -1
+        result = result or -1
+        self.__class__.DNSInstallDir = result
+        if result == -1:
+            self.__class__.DNSVersion = result
+        else:
+            self.__class__.DNSVersion = None
+            self.__class__.DNSVersion = self.getDNSVersion()
+        self.DNSName = self.getDNSName()
+
+    def refreshDNSIniDir(self):
+        """get DNSIniDir again, and update the value cached in NatlinkStatus
+        
+        -1 if not found, as in NatlinkStatus.__init__
+        """
+        try:
+            result = self.getDNSIniDir(force=1)
+        except OSError:
+            result = -1
+        self.__class__.DNSIniDir = result or -1
 
     def setUserDirectory(self, v):
         """set UserDirectory in ini file settings
@@ -603,8 +712,9 @@ Natlink is now disabled.
         key = 'UserDirectory'
         if v and self.isValidPath(v):
             print(("Setting the UserDirectory of Natlink to %s"% v))
-            self.userinisection.set(key, v)
-            self.userinisection.delete("Old"+key)
+            with self.userinisection.batch():
+                self.userinisection.set(key, v)
+                self.userinisection.delete("Old"+key)
         else:
             print(('Setting the UserDirectory of Natlink failed, not a valid directory: %s'% v))
 
@@ -612,12 +722,7 @@ Natlink is now disabled.
     def clearUserDirectory(self):
         """reset UserDirectory setting in ini file
         """
-        key = 'UserDirectory'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
-        if self.userinisection.get(key):
-            self.userinisection.delete(key)
+        if self._clearWithBackup('UserDirectory'):
             print('clearing UserDirectory of Natlink')
         else:
             print('The UserDirectory of Natlink was not set, nothing changed...')
@@ -641,9 +746,7 @@ Natlink is now disabled.
         Unimacro is expected at ../../Unimacro relative to the Core directory
         """
         key = 'IncludeUnimacroInPythonPath'
-        Keys = list(self.userinisection.keys())
-
-        if key in Keys:
+        if key in self.userinisection:
             print(('clearing variable %s'% key))
             self.userinisection.delete(key)
         else:
@@ -663,19 +766,10 @@ Natlink is now disabled.
             self.warning('Cannot enable Natlink, because registering natlink.pyd failed')
             return
         nssystemini = self.getNSSYSTEMIni()
-        section1 = self.section1
-        key1 = self.key1
-        value1 = self.value1
-        #
-        # try:
-        win32api.WriteProfileVal(section1, key1, value1, nssystemini)
+        self.writeProfileValIfChanged(self.section1, self.key1, self.value1, nssystemini)
 
         nsappsini = self.getNSAPPSIni()
-        section2 = self.section2
-        key2 = self.key2
-        value2 = self.value2
-        # try:
-        win32api.WriteProfileVal(section2, key2, value2, nsappsini)
+        self.writeProfileValIfChanged(self.section2, self.key2, self.value2, nsappsini)
         result = self.NatlinkIsEnabled(silent=1, force=True)
         if not result:
             text = \
@@ -693,6 +787,17 @@ Probably you did not run this program in "elevated mode". Please try to do so.
                 self.warning("failed to enable Natlink")
 
 
+    def writeProfileValIfChanged(self, section, key, value, inifile):
+        """write value into the Dragon INI file, only if it is not already there
+
+        reading is cheap, writing rewrites the whole INI file.
+        (so enabling an already enabled Natlink does not touch the INI files)
+        """
+        #pylint:disable=R0201
+        if win32api.GetProfileVal(section, key, "", inifile) == value:
+            return
+        win32api.WriteProfileVal(section, key, value, inifile)
+
     def disableNatlink(self, silent=None):
         """only do the nssystem.ini setting
         """
@@ -735,8 +840,9 @@ Probably you did not run this program in "elevated mode". Please try to do so.
         v = os.path.normpath(os.path.expanduser(v))
         if self.isValidPath(v, wantDirectory=1):
             # print(f'Enable Vocola, with setting VocolaUserDirectory {v}')
-            self.userinisection.set(key, v)
-            self.userinisection.delete("Old"+key)
+            with self.userinisection.batch():
+                self.userinisection.set(key, v)
+                self.userinisection.delete("Old"+key)
             self.VocolaUserDirectory = v
             return None
         oldvocdir = self.userinisection.get(key)
@@ -749,13 +855,8 @@ Probably you did not run this program in "elevated mode". Please try to do so.
     def clearVocolaUserDirectory(self):
         """empty VocolaUserDirectory setting in inifile
         """
-        key = 'VocolaUserDirectory'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
         self.VocolaUserDirectory = "" 
-        if self.userinisection.get(key):
-            self.userinisection.delete(key)
+        if self._clearWithBackup('VocolaUserDirectory'):
             return None
         # else:
         mess = 'no valid VocolaUserDirectory, so Vocola was already disabled'
@@ -778,8 +879,9 @@ Probably you did not run this program in "elevated mode". Please try to do so.
             exepath = os.path.join(ahkexedir, 'autohotkey.exe')
             if os.path.isfile(exepath):
                 print(('Set AutoHotkey Exe Directory (AhkExeDir) to %s'% v))
-                self.userinisection.set(key, v)
-                self.userinisection.delete('Old'+key)
+                with self.userinisection.batch():
+                    self.userinisection.set(key, v)
+                    self.userinisection.delete('Old'+key)
                 return None
             # else:
             mess = 'path does not contain "autohotkey.exe": %s'% v
@@ -791,12 +893,7 @@ Probably you did not run this program in "elevated mode". Please try to do so.
     def clearAhkUserDir(self):
         """clear AutoHotkey setting in inifile
         """
-        key = 'AhkUserDir'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
-        if self.userinisection.get(key):
-            self.userinisection.delete(key)
+        if self._clearWithBackup('AhkUserDir'):
             print('Clear AutoHotkey User Directory (AhkUserDir)')
             return None
         # else:
@@ -815,8 +912,9 @@ Probably you did not run this program in "elevated mode". Please try to do so.
         ahkuserdir = self.isValidPath(v, wantDirectory=1)
         if ahkuserdir:
             print(('Set AutoHotkey User Directory (AhkUserDir) to %s'% v))
-            self.userinisection.set(key, v)
-            self.userinisection.delete('Old'+key)
+            with self.userinisection.batch():
+                self.userinisection.set(key, v)
+                self.userinisection.delete('Old'+key)
             return None
         mess = 'not a valid directory: %s'% v
         return mess
@@ -824,12 +922,7 @@ Probably you did not run this program in "elevated mode". Please try to do so.
     def clearAhkExeDir(self):
         """empty AutoHotkey exe dir in inifile
         """
-        key = 'AhkExeDir'
-        oldvalue = self.userinisection.get(key)
-        if oldvalue and self.isValidPath(oldvalue):
-            self.userinisection.set("Old"+key, oldvalue)
-        if self.userinisection.get(key):
-            self.userinisection.delete(key)
+        if self._clearWithBackup('AhkExeDir'):
             print('Clear AutoHotkey Exe Directory (AhkExeDir)')
             return None
         mess = 'AutoHotkey Exe Directory (AhkExeDir) was not set, do nothing'
@@ -852,14 +945,15 @@ Probably you did not run this program in "elevated mode". Please try to do so.
                 print('\n-----------\nChanging your UnimacroUserDirectory\nConsider copying inifile subdirectories (enx_inifiles or nld_inifiles)\n' \
                       'from old: "{oldDir}" to the\n' \
                       'new UnimacroUserDirectory "{uuDir}"\n--------\n')
-            self.userinisection.set(key, v)
+            with self.userinisection.batch():
+                self.userinisection.set(key, v)
+                self.userinisection.delete('Old'+key)
             
             self.UnimacroUserDirectory = uuDir
             
             # clear this one, in order to refresh next time it is called:
             self.UnimacroGrammarsDirectory = None
             
-            self.userinisection.delete('Old'+key)
             print(f'Enable Unimacro, and set UnimacroUserDirectory to {uuDir}')
             return None
         mess = f'natlinkconfigfunctions, could not Enable Unimacro, and set the UnimacroUserDirectory to "{v}"'
@@ -867,60 +961,60 @@ Probably you did not run this program in "elevated mode". Please try to do so.
 
     def clearUnimacroUserDirectory(self):
         """clear but keep previous value"""
-        key = 'UnimacroUserDirectory'
-        oldValue = self.userinisection.get(key)
         self.UnimacroUserDirectory = ""
 
         ## also clear this one:
         self.UnimacroGrammarsDirectory = ""
 
-        self.userinisection.delete(key)
-        oldDirectory = self.isValidPath(oldValue)
-        if oldDirectory:
-            keyOld = 'Old' + key
-            self.userinisection.set(keyOld, oldValue)
-        else:
-            print('- UnimacroUserDirectory seems to be already cleared, Unimacro remains disabled')
+        self._clearWithBackup('UnimacroUserDirectory',
+                              invalidMessage='- UnimacroUserDirectory seems to be already cleared, Unimacro remains disabled')
             
     def setUnimacroIniFilesEditor(self, v):
         """set editor for inifiles in Unimacro
+
+        returns a message if v is not a valid .exe file
         """
         #pylint:disable=W0201
         key = "UnimacroIniFilesEditor"
         exefile = self.isValidPath(v, wantFile=1)
         if exefile and v.endswith(".exe"):
-            self.userinisection.set(key, v)
-            self.userinisection.delete("Old"+key)
+            with self.userinisection.batch():
+                self.userinisection.set(key, v)
+                self.userinisection.delete("Old"+key)
             try:
                 del self.UnimacroIniFilesEditor
             except AttributeError:
                 pass
             self.UnimacroIniFilesEditor = v
             print(f'natlinkconfigfunctions, Set UnimacroIniFilesEditor to {v}')
-        else:
-            print(f'natlinkconfigfunctions, setUnimacroIniFilesEditor, not a valid .exe file: "{v}')
+            return None
+        mess = f'natlinkconfigfunctions, setUnimacroIniFilesEditor, not a valid .exe file: "{v}"'
+        return mess
 
     def clearUnimacroIniFilesEditor(self):
         """clear setting Unimacro inifiles editor
         """ 
-        key = "UnimacroIniFilesEditor"
-        oldvalue = self.userinisection.get(key)
-        oldexefile = self.isValidPath(oldvalue, wantFile=1)
-        if oldexefile:
-            self.userinisection.set("Old"+key, oldvalue)
-        self.userinisection.delete(key)
+        self._clearWithBackup("UnimacroIniFilesEditor", wantFile=1)
         print('UnimacroIniFilesEditor cleared')
 
+    @functools.cached_property
+    def natlinkPydPath(self):
+        """the natlink.pyd in the Natlink directory, that directory does not change in a session
+        """
+        return os.path.join(self.getNatlinkDirectory(), 'natlink.pyd')
+
     def registerNatlinkPyd(self, silent=1):
         """register natlink.pyd
 
-        if silent, do through win32api, and not report. This is done whenever Natlink is enabled.
+        if silent, run "regsvr32 /s", and not report. This is done whenever Natlink is enabled.
+
+        if NOT silent, regsvr32 produces a message window.
 
-        if NOT silent, go through os.system, and produce a message window.
+        regsvr32 is run directly (no shell, no console window), returns True if it succeeded.
 
         Note: NO registry setting any more! (March 2021)
         """
-        PydPath = os.path.join(self.getNatlinkDirectory(), 'natlink.pyd')
+        PydPath = self.natlinkPydPath
 
         if not os.path.isfile(PydPath):
             self.fatal_error("Pyd file not found in core folder: %s"% PydPath)
@@ -928,57 +1022,47 @@ Probably you did not run this program in "elevated mode". Please try to do so.
         result = self.PydIsRegistered(PydPath)
         # print(f'natlink.pyd was already registered: {PydPath}, still do it again...')
 
+        args = ['regsvr32', '/s', PydPath] if silent else ['regsvr32', PydPath]
+        try:
+            result = subprocess.run(args, creationflags=subprocess.CREATE_NO_WINDOW, check=False).returncode
+        except OSError:
+            self.fatal_error(f'cannot register "{PydPath}"')
+            return None
+        if result:
+            self.fatal_error(f'failed to register "{PydPath}" (result: {result})')
+            return None
         if silent:
-            # try:
-            #     import win32api
-            # except:
-            #     self.fatal_error("cannot import win32api, please see if win32all of python is properly installed")
-
-            try:
-                result = win32api.WinExec(f'regsvr32 /s "{PydPath}"')
-                if result:
-                    self.fatal_error(f'failed to register {PydPath} (result: {result})')
-                    return None
-                print(f'registered "{PydPath}"')
-            except:
-                self.fatal_error(f'cannot register "{PydPath}"')
-                return None
+            print(f'registered "{PydPath}"')
         else:
-            # os.system:
-            result = os.system(f'regsvr32 "{PydPath}"')
-            if result:
-                self.fatal_error(f'Failed to register "{PydPath}" (result: {result})')
-            else:
-                print(f'Registering pyd file succesful: "{PydPath}"')
-
-        ## should return True then:
-        return result is None
+            print(f'Registering pyd file succesful: "{PydPath}"')
+        return True
 
     def PydIsRegistered(self, PydPath):
         """returns True if path is registered as dll/pyd
 
-        seems not to work or give complications.
+        reads the InprocServer32 entry of the Natlink CLSID (32 bit view of the registry),
+        instead of loading the pyd. If the registry cannot be read, only check the file exists.
         """
-        #pylint:disable=R0201, W0212
+        subKey = rf'CLSID\{self.NATLINK_CLSID}\InprocServer32'
         try:
-            # pass this step if it does not succeed:
-            dll = ctypes.windll[PydPath]
-            return True
-        except WindowsError:
-            dll = None
+            with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, subKey, 0,
+                                winreg.KEY_READ | winreg.KEY_WOW64_32KEY) as key:
+                registeredPath, _type = winreg.QueryValueEx(key, '')
+        except FileNotFoundError:
             return False
-        finally:
-            if dll:
-                handle = dll._handle # obtain the DLL handle
-                _result2 = ctypes.windll.kernel32.FreeLibrary(handle)
+        except OSError:
+            return os.path.isfile(PydPath)
+        return os.path.normcase(registeredPath) == os.path.normcase(PydPath)
 
     def unregisterNatlinkPyd(self, silent=1):
         """unregister explicit, should not be done normally
         """
-        #pylint:disable=W0613, W0212
+        #pylint:disable=W0613, W0212, C0415
+        import ctypes
+        import traceback
         # dummy, dummy = self.getRegistryPythonPathDict(flags=win32con.KEY_ALL_ACCESS)
         _pythonVersion = self.getPythonVersion()
-        PydPath = os.path.join(coreDir, 'natlink.pyd')
+        PydPath = self.natlinkPydPath
 
         # if not self.PydIsRegistered(PydPath):
         #     print 'unregisterNatlinkPyd: is not registered, %s'% PydPath
@@ -1083,29 +1167,31 @@ Probably you did not run this program in "elevated mode". Please try to do so.
         #                                            'Unimacro',
         #                                            'Vocola_compatibility'))
         toFolder = self.getVocolaUserDirectory()
-        if os.path.isdir(fromFolder):
+        if toFolder and os.path.isdir(toFolder):
             fromFile = os.path.join(fromFolder,uscFile)
-            if os.path.isfile(fromFile):
-                if os.path.isdir(toFolder):
-
-                    toFile = os.path.join(toFolder, uscFile)
-                    if os.path.isfile(toFile):
-                        print(('remove previous %s'% toFile))
-                        try:
-                            os.remove(toFile)
-                        except:
-                            pass
-                    print(('copy %s from %s to %s'%(uscFile, fromFolder, toFolder)))
-                    try:
-                        shutil.copyfile(fromFile, toFile)
-                    except:
-                        pass
-                    else:
-                        oldUscFile = os.path.join(toFolder, oldUscFile)
-                        if os.path.isfile(oldUscFile):
-                            print(('remove old usc.vcl file: %s'% oldUscFile))
-                            os.remove(oldUscFile)
-                        return None
+            toFile = os.path.join(toFolder, uscFile)
+            # copy next to the target and swap in one step, a previous file is replaced:
+            tmpFile = toFile + '.tmp'
+            try:
+                shutil.copyfile(fromFile, tmpFile)
+                os.replace(tmpFile, toFile)
+            except FileNotFoundError:
+                pass    # no Unimacro.vch to copy
+            except OSError:
+                try:
+                    os.remove(tmpFile)
+                except OSError:
+                    pass
+            else:
+                print(('copied %s from %s to %s'%(uscFile, fromFolder, toFolder)))
+                oldUscFile = os.path.join(toFolder, oldUscFile)
+                try:
+                    os.remove(oldUscFile)
+                except FileNotFoundError:
+                    pass
+                else:
+                    print(('removed old usc.vcl file: %s'% oldUscFile))
+                return None
         mess = "could not copy file %s from %s to %s"%(uscFile, fromFolder, toFolder)
         print(mess)
         return mess
@@ -1114,57 +1200,54 @@ Probably you did not run this program in "elevated mode". Please try to do so.
     def includeUnimacroVchLineInVocolaFiles(self, subDirectory=None):
         """include the Unimacro wrapper support line into all Vocola command files
 
+        the language subfolders (VocolaLanguageFolders) are done in the same walk.
+
         as a side effect, set the variable for Unimacro in Vocola support:
         VocolaTakesUnimacroActions...
         """
         #pylint:disable=R0914, R0912
         uscFile = 'Unimacro.vch'
-        oldUscFile = 'usc.vch'
-##        reInclude = re.compile(r'^include\s+.*unimacro.vch;$', re.MULTILINE)
-##        reOldInclude = re.compile(r'^include\s+.*usc.vch;$', re.MULTILINE)
 
-        # also remove includes of usc.vch
+        # also remove includes of usc.vch, and wrong includes of Unimacro.vch
         toFolder = self.getVocolaUserDirectory()
         if subDirectory:
             toFolder = os.path.join(toFolder, subDirectory)
-            includeLine = 'include ..\\%s;\n'% uscFile
-        else:
-            includeLine = 'include %s;\n'%uscFile
-        oldIncludeLines = ['include %s;'% oldUscFile,
-                           'include ..\\%s;'% oldUscFile,
-                           'include %s;'% uscFile.lower(),
-                           'include ..\\%s;'% uscFile.lower(),
-                           ]
 
         if not os.path.isdir(toFolder):
             mess = 'cannot find Vocola command files directory, not a valid path: %s'% toFolder
             print(mess)
             return mess
         nFiles = 0
-        for f in os.listdir(toFolder):
-            F = os.path.join(toFolder, f)
-            if f.endswith(".vcl"):
+        for dirpath, dirnames, filenames in os.walk(toFolder):
+            dirnames[:] = [d for d in dirnames if d.lower() in VocolaLanguageFolders]
+            if subDirectory or dirpath != toFolder:
+                includeLine = 'include ..\\%s;\n'% uscFile
+            else:
+                includeLine = 'include %s;\n'%uscFile
+            includeLineStripped = includeLine.strip()
+            for f in filenames:
+                if not f.endswith(".vcl"):
+                    continue
+                F = os.path.join(dirpath, f)
                 changed = 0
                 correct = 0
                 Output = []
-                for line in open(F, 'r'):
-                    if line.strip() == includeLine.strip():
+                with open(F, 'r') as fp:
+                    lines = fp.read().splitlines(keepends=True)
+                for line in lines:
+                    if line.strip() == includeLineStripped:
                         correct = 1
-                    for oldLine in oldIncludeLines:
-                        if line.strip() == oldLine:
-                            changed = 1
-                            break
-                    else:
-                        Output.append(line)
+                    elif _reUnimacroInclude.match(line):
+                        changed = 1
+                        continue
+                    Output.append(line)
                 if changed or not correct:
                     # changes were made:
                     if not correct:
                         Output.insert(0, includeLine)
-                    open(F, 'w').write(''.join(Output))
+                    with open(F, 'w') as fp:
+                        fp.write(''.join(Output))
                     nFiles += 1
-            elif len(f) == 3 and os.path.isdir(F):
-                # subdirectory, recursive
-                self.includeUnimacroVchLineInVocolaFiles(F)
         self.enableVocolaTakesUnimacroActions()
         mess = 'changed %s files in %s, and set the variable "%s"'% (nFiles, toFolder,
                                                                      "VocolaTakesUnimacroActions")
@@ -1174,55 +1257,41 @@ Probably you did not run this program in "elevated mode". Please try to do so.
 
     def removeUnimacroVchLineInVocolaFiles(self, subDirectory=None):
         """remove the Unimacro wrapper support line into all Vocola command files
+        
+        the language subfolders (VocolaLanguageFolders) are done in the same walk.
         """
         #pylint:disable=        
-        uscFile = 'Unimacro.vch'
-        oldUscFile = 'usc.vch'
-##        reInclude = re.compile(r'^include\s+.*unimacro.vch;$', re.MULTILINE)
-##        reOldInclude = re.compile(r'^include\s+.*usc.vch;$', re.MULTILINE)
-
         # also remove includes of usc.vch
         if subDirectory:
-            # for recursive call language subfolders:
             toFolder = subDirectory
         else:
             toFolder = self.getVocolaUserDirectory()
 
-        oldIncludeLines = ['include %s;'% oldUscFile,
-                           'include ..\\%s;'% oldUscFile,
-                           'include %s;'% uscFile,
-                           'include ..\\%s;'% uscFile,
-                           'include ../%s;'% oldUscFile,
-                           'include ../%s;'% uscFile,
-                           'include %s;'% uscFile.lower(),
-                           'include ..\\%s;'% uscFile.lower(),
-                           'include ../%s;'% uscFile.lower(),
-                           ]
-
-
         if not os.path.isdir(toFolder):
             mess = 'cannot find Vocola command files directory, not a valid path: %s'% toFolder
             print(mess)
             return mess
         nFiles = 0
-        for f in os.listdir(toFolder):
-            F = os.path.join(toFolder, f)
-            if f.endswith(".vcl"):
+        for dirpath, dirnames, filenames in os.walk(toFolder):
+            dirnames[:] = [d for d in dirnames if d.lower() in VocolaLanguageFolders]
+            for f in filenames:
+                if not f.endswith(".vcl"):
+                    continue
+                F = os.path.join(dirpath, f)
                 changed = 0
                 Output = []
-                for line in open(F, 'r'):
-                    for oldLine in oldIncludeLines:
-                        if line.strip() == oldLine:
-                            changed = 1
-                            break
-                    else:
-                        Output.append(line)
+                with open(F, 'r') as fp:
+                    lines = fp.read().splitlines(keepends=True)
+                for line in lines:
+                    if _reUnimacroInclude.match(line):
+                        changed = 1
+                        continue
+                    Output.append(line)
                 if changed:
-                    # had break, so changes were made:
-                    open(F, 'w').write(''.join(Output))
+                    # include lines were skipped, so changes were made:
+                    with open(F, 'w') as fp:
+                        fp.write(''.join(Output))
                     nFiles += 1
-            elif len(f) == 3 and os.path.isdir(F):
-                self.removeUnimacroVchLineInVocolaFiles(F)
         mess = 'removed include lines from %s files in %s'% (nFiles, toFolder)
         print(mess)
         return None
@@ -1283,7 +1352,33 @@ Probably you did not run this program in "elevated mode". Please try to do so.
 
 
 
-def _main(Options=None):
+# the CLI used by _main, built at the first call and kept for the next calls:
+_SHARED_CLI = None
+# options of _main that change what NatlinkConfig and CLI check at construction
+# (Dragon directories, natlink.pyd registration), after these the shared CLI is dropped:
+_FRESH_STATE_OPTIONS = frozenset('dDcCeErRzZ')
+
+def getSharedCli():
+    """return the CLI kept for _main, build it (and check the configuration) only once
+    """
+    #pylint:disable=W0603
+    global _SHARED_CLI
+    if _SHARED_CLI is None:
+        _SHARED_CLI = CLI()
+    return _SHARED_CLI
+
+def resetSharedCli():
+    """forget the CLI kept for _main, the next call starts with a fresh NatlinkConfig
+    
+    done by _main after options in _FRESH_STATE_OPTIONS, and useful for tests
+    """
+    #pylint:disable=W0603
+    global _SHARED_CLI
+    if _SHARED_CLI is not None:
+        _SHARED_CLI.config.closeRegistryKeys()
+    _SHARED_CLI = None
+
+def _main(Options=None, cli=None):
     """Catch the options and perform the resulting command line functions
 
     options: -i, --info: give status info
@@ -1291,10 +1386,14 @@ def _main(Options=None):
              -I, --reginfo: give the info in the registry about Natlink
              etc., usage above...
 
+    cli: the CLI instance to use, by default the shared one, so calling
+         _main again does not redo the checks of NatlinkConfig and CLI.
+         The shared one is dropped after an option in _FRESH_STATE_OPTIONS.
+
     """
-    cli = CLI()
-    shortOptions = "aAiIeEfFgGyYxXDCVbBNOPlmMrRzZuq"
-    shortArgOptions = "d:c:v:n:o:p:"
+    sharedCli = cli is None
+    if sharedCli:
+        cli = getSharedCli()
     if Options:
         if isinstance(Options, str):
             Options = Options.split(" ", 1)
@@ -1303,7 +1402,7 @@ def _main(Options=None):
         Options = sys.argv[1:]
 
     try:
-        options, args = getopt.getopt(Options, shortOptions+shortArgOptions)
+        options, args = getopt.getopt(Options, _SHORT_OPTIONS+_SHORT_ARG_OPTIONS)
     except getopt.GetoptError:
         print(('invalid option: %s'% repr(Options)))
         cli.usage()
@@ -1311,21 +1410,27 @@ def _main(Options=None):
 
     if args:
         print(('should not have extraneous arguments: %s'% repr(args)))
-    for o, v in options:
-        o = o.lstrip('-')
-        funcName = 'do_%s'% o
-        func = getattr(cli, funcName, None)
-        if not func:
-            print(('option %s not found in cli functions: %s'% (o, funcName)))
-            cli.usage()
-            continue
-        if o in shortOptions:
-            func(None) # dummy arg
-        elif o in shortArgOptions:
-            func(v)
+    freshState = False
+    try:
+        for o, v in options:
+            o = o.lstrip('-')
+            try:
+                funcName, takesArg = _OPTION_METHODS[o]
+            except KeyError:
+                print(('option %s not found in cli functions: do_%s'% (o, o)))
+                cli.usage()
+                continue
+            freshState = freshState or o in _FRESH_STATE_OPTIONS
+            func = getattr(cli, funcName)
+            if takesArg:
+                func(v)
+            else:
+                func(None) # dummy arg
+    finally:
+        if sharedCli and freshState:
+            resetSharedCli()   # also closes the registry keys
         else:
-            print('options should not come here')
-            cli.usage()
+            cli.config.closeRegistryKeys()
 
 
 
@@ -1335,6 +1440,10 @@ class CLI(cmd.Cmd):
     #pylint:disable=R0904, C0116, W0613, R1710, R0201, W0201
     def __init__(self, Config=None):
         cmd.Cmd.__init__(self)
+        # the commands and help topics do not change, look them up once (see onecmd, do_help and get_names):
+        self._names = dir(self.__class__)
+        self._do = {name[3:]: getattr(self, name) for name in self._names if name.startswith('do_')}
+        self._help = {name[5:]: getattr(self, name) for name in self._names if name.startswith('help_')}
         self.prompt = '\nConfig Natlink> '
         self.info = "type 'u' for usage"
         if Config:
@@ -1353,18 +1462,24 @@ class CLI(cmd.Cmd):
             self.config.clearRegistryPythonPathNatlink()  # not needed any more for python 3
             self.checkedConfig = self.config.checkedUrgent
             self.isValidPath = self.config.isValidPath  ## convenient
-            for key in ObsoleteStatusKeys:
-                # see at top of this file!
-                if key in list(self.config.userinisection.keys()):
-                    print(('remove obsolete key from natlinkstatus.ini: "%s"'% key))
-                    self.config.userinisection.delete(key)
+            with self.config.userinisection.batch():
+                for key in ObsoleteStatusKeys:
+                    # see at top of this file!
+                    if key in self.config.userinisection:
+                        print(('remove obsolete key from natlinkstatus.ini: "%s"'% key))
+                        self.config.userinisection.delete(key)
             self.DNSName = self.config.getDNSName()
             self.config.configCheckNatlinkPydFile()
-        except ElevationError:
-            e = sys.exc_info()[1]
+        except ElevationError as e:
             print(('You need to run this program in elevated mode. (%s).'% e.message))
             raise
 
+        # the Dragon name does not change, format these help texts only once:
+        self._HELP_I = _helpText(self._HELP_I_TEMPLATE.format(DNSName=self.DNSName))
+        self._HELP_D = _helpText(self._HELP_D_TEMPLATE.format(DNSName=self.DNSName))
+        self._HELP_C = _helpText(self._HELP_C_TEMPLATE.format(DNSName=self.DNSName))
+        self._HELP_E = _helpText(self._HELP_E_TEMPLATE.format(DNSName=self.DNSName))
+
         if __name__ == "__main__":
             print("Type 'u' for a usage message")
 
@@ -1374,31 +1489,72 @@ class CLI(cmd.Cmd):
 
         Return "" if directory is not valid
         """
-        #pylint:disable=R0201
         if not dirName:
             return ""
-        n = dirName.strip()
-        while n and n.startswith('"'):
-            n = n.strip('"')
-        while n and n.startswith("'"):
-            n = n.strip("'")
-        if n:
-            n.strip()
+        n = self.stripQuotes(dirName)
 
         if os.path.isdir(n):
             return n
         print(('not a valid directory: %s (%s)'% (n, dirName)))
         return ''
 
+    def requireElevation(self, message):
+        """raise ElevationError(message) if this program does not run in elevated mode
+
+        NatlinkConfig asks Windows for this only once per session
+        """
+        if not self.config.isElevated:
+            raise ElevationError(message)
+
+    def stripQuotes(self, arg):
+        """allow quotes in input, and strip them (and spaces)
+        """
+        #pylint:disable=R0201
+        n = arg.strip()
+        while n and n.startswith('"'):
+            n = n.strip('"')
+        while n and n.startswith("'"):
+            n = n.strip("'")
+        return n.strip()
+
+    def onecmd(self, line):
+        """as cmd.Cmd.onecmd, but find the do_ method in the _do dict
+        """
+        command, arg, line = self.parseline(line)
+        if not line:
+            return self.emptyline()
+        if command is None:
+            return self.default(line)
+        self.lastcmd = line
+        if line == 'EOF':
+            self.lastcmd = ''
+        func = self._do.get(command)
+        if func is None:
+            return self.default(line)
+        return func(arg)
+
+    def do_help(self, arg):
+        """as cmd.Cmd.do_help, but find the help_ method in the _help dict
+        """
+        func = self._help.get(arg) if arg else None
+        if func is None:
+            return cmd.Cmd.do_help(self, arg)
+        return func()
+
+    def get_names(self):
+        """as cmd.Cmd.get_names, but without a dir() call each time (completion, help listing)
+        """
+        return self._names
+
 
 
     def usage(self):
         """gives the usage of the command line options or options when
         the command line interface  (CLI) is used
         """
-        #pylint:disable=R0201        
-        print(('-'*60))
-        print("""Use either from the command line like 'natlinkconfigfunctions.py -i'
+        sys.stdout.write(self._USAGE)
+
+    _USAGE = _helpText("""Use either from the command line like 'natlinkconfigfunctions.py -i'
 or in an interactive session using the CLI (command line interface).
 
 [Status]
@@ -1453,7 +1609,6 @@ q       - quit
 
 help <command>: give more explanation on <command>
         """)
-        print(('='*60))
 
     # info----------------------------------------------------------
     def do_i(self, arg):
@@ -1467,9 +1622,8 @@ help <command>: give more explanation on <command>
         # print PythonPath:
         self.config.printPythonPath()
 
-    def help_i(self):
-        print(('-'*60))
-        print(("""The command info (i) gives an overview of the settings that are
+    # formatted with the Dragon name in __init__, as _HELP_I:
+    _HELP_I_TEMPLATE = """The command info (i) gives an overview of the settings that are
 currently set inside the Natlink system.
 
 The command settings (I) gives all the Natlink settings, kept in
@@ -1481,9 +1635,11 @@ Natlink directories after the config GUI runs succesfully
 Settings are set by either the Natlink/Vocola/Unimacro installer
 or by functions that are called by the CLI (command line interface).
 
-After you change settings, restart %s.
-"""% self.DNSName))
-        print(('='*60))
+After you change settings, restart {DNSName}.
+"""
+
+    def help_i(self):
+        sys.stdout.write(self._HELP_I)
     help_j = help_I = help_i
 
     # DNS install directory------------------------------------------
@@ -1499,19 +1655,20 @@ After you change settings, restart %s.
         print(('do action: %s'% self.message))
         return self.config.clearDNSInstallDir()
 
-    def help_d(self):
-        print(('-'*60))
-        print(f'''Set (d <path>) or clear (D) the directory where {self.DNSName} is installed.
+    # formatted with the Dragon name in __init__, as _HELP_D:
+    _HELP_D_TEMPLATE = """Set (d <path>) or clear (D) the directory where {DNSName} is installed.
               
 The setting is preserved in the usersettings in natlinkstatus.ini in the ~/.Natlink directory
 
-Setting is only needed when {self.DNSName} is not found at one of the "normal" places.
+Setting is only needed when {DNSName} is not found at one of the "normal" places.
 So setting is seldom not needed.
 
 After you clear this setting, Natlink will, at starting time, again
-search for the {self.DNSName} install directory in the "normal" place
-''')
-        print(('='*60))
+search for the {DNSName} install directory in the "normal" place
+"""
+
+    def help_d(self):
+        sys.stdout.write(self._HELP_D)
     help_D = help_d
 
     # DNS INI directory-----------------------------------------
@@ -1528,18 +1685,19 @@ search for the {self.DNSName} install directory in the "normal" place
         self.message = f'Clear {self.DNSName} INI files directory in the usersettings'
         print(f'do action: {self.message}')
         return self.config.clearDNSIniDir()
-    def help_c(self):
-        print(('-'*60))
-        print(f'''Set (c <path>) or clear (C) the directory where {self.DNSName} INI file locations
+    # formatted with the Dragon name in __init__, as _HELP_C:
+    _HELP_C_TEMPLATE = """Set (c <path>) or clear (C) the directory where {DNSName} INI file locations
 (nssystem.ini and nsapps.ini) are located.
 
 This is only rarely needed if these cannot be found in the normal place(s):
 -if you have an "alternative" place where you keep your speech profiles
 
-After Clearing this registry entry Natlink will, when it is started by {self.DNSName},
+After Clearing this registry entry Natlink will, when it is started by {DNSName},
 again search for its INI files in the "default/normal" place(s).
-''')
-        print(('='*60))
+"""
+
+    def help_c(self):
+        sys.stdout.write(self._HELP_C)
     help_C = help_c
 
     # User Directories -------------------------------------------------
@@ -1565,37 +1723,34 @@ again search for its INI files in the "default/normal" place(s).
     #     self.message = "Do NOT include UnimacroDirectory in PythonPath when Unimacro is disabled"
     #     self.config.ignoreUnimacroDirectoryInPathIfNotUserDirectory()
 
-    def help_n(self):
-        print(('-'*60))
-        print("""Sets (n <path>) or clears (N) the UserDirectory of Natlink.
+    _HELP_N = _helpText("""Sets (n <path>) or clears (N) the UserDirectory of Natlink.
 This is the folder where your own python grammar files are/will be located.
 
 Note this should NOT be the BaseDirectory (Vocola is there) of the Unimacro directory.
 """)
-        print(('='*60))
+
+    def help_n(self):
+        sys.stdout.write(self._HELP_N)
 
     help_N = help_n
 
     # Unimacro User directory and Editor or Unimacro INI files-----------------------------------
     def do_o(self, arg):
-        if not arg.strip():
-            print('natlinkconfigfunctions, enable Unimacro, needs the UnimacroUserDirectory to be passed')
-            return
-        arg = self.stripCheckDirectory(arg)  # also quotes
+        arg = self.stripQuotes(arg)
         if not arg:
-            print(f'natlinkconfigfunctions, enable Unimacro, needs a valid (UnimacroUserDirectory) to be passed, not: {arg}')
+            print('natlinkconfigfunctions, enable Unimacro, needs the UnimacroUserDirectory to be passed')
             return
-        self.config.setUnimacroUserDirectory(arg)
+        # the setter checks the directory (~ and %...% allowed):
+        mess = self.config.setUnimacroUserDirectory(arg)
+        if mess:
+            print(mess)
 
     def do_O(self, arg):
         self.message = "Clearing UnimacroUserDirectory, and disable Unimacro"
         print(('natlinkconfigfunctions: %s'% self.message))
         self.config.clearUnimacroUserDirectory()
 
-    def help_o(self):
-        print(('-'*60))
-        _userDir = self.config.getUserDirectory()
-        print("""set/clear UnimacroUserDirectory (o <path>/O)
+    _HELP_O = _helpText("""set/clear UnimacroUserDirectory (o <path>/O)
 
 And enable/disable Unimacro.
 
@@ -1607,27 +1762,27 @@ another environment variable (%%...%%). (example: "o ~/Natlink/Unimacro")
 
 Setting this directory also enables Unimacro. Clearing it disables Unimacro
 """)
-        print(('='*60))
+
+    def help_o(self):
+        sys.stdout.write(self._HELP_O)
 
     help_O = help_o
 
     # Unimacro Command Files Editor-----------------------------------------------
     def do_p(self, arg):
-        if os.path.isfile(arg) and arg.endswith(".exe"):
-            self.message = "Setting (path to) Unimacro INI Files editor to %s"% arg
-            print(('do action: %s'% self.message))
-            self.config.setUnimacroIniFilesEditor(arg)
-        else:
-            print(('Please specify a valid path for the Unimacro INI files editor, not |%s|'% arg))
+        arg = self.stripQuotes(arg)
+        self.message = "Setting (path to) Unimacro INI Files editor to %s"% arg
+        # the setter checks the .exe file:
+        mess = self.config.setUnimacroIniFilesEditor(arg)
+        if mess:
+            print(mess)
 
     def do_P(self, arg):
         self.message = "Clear Unimacro INI file editor, go back to default Notepad"
         print(('do action: %s'% self.message))
         self.config.clearUnimacroIniFilesEditor()
 
-    def help_p(self):
-        print(('-'*60))
-        print("""set/clear path to Unimacro INI files editor (p <path>/P)
+    _HELP_P = _helpText("""set/clear path to Unimacro INI files editor (p <path>/P)
 
 By default (when you clear this setting) "notepad" is used, but:
 
@@ -1637,7 +1792,9 @@ TextPad, NotePad++, UltraEdit, or win32pad
 You can even specify Wordpad, maybe Microsoft Word...
 
 """)
-        print(('='*60))
+
+    def help_p(self):
+        sys.stdout.write(self._HELP_P)
 
     help_P = help_p
 
@@ -1649,9 +1806,7 @@ You can even specify Wordpad, maybe Microsoft Word...
         print(('do action: %s'% self.message))
         self.config.copyUnimacroIncludeFile()
 
-    def help_l(self):
-        print(('-'*60))
-        print("""Copy Unimacro.vch header file into Vocola User Files directory      (l)
+    _HELP_L = _helpText("""Copy Unimacro.vch header file into Vocola User Files directory      (l)
 
 Insert/remove 'include Unimacro.vch' lines into/from each Vocola
 command file                                                        (m/M)
@@ -1659,7 +1814,9 @@ command file                                                        (m/M)
 Using Unimacro.vch, you can call Unimacro shorthand commands from a
 Vocola command.
 """)
-        print(('='*60))
+
+    def help_l(self):
+        sys.stdout.write(self._HELP_L)
 
     def do_m(self, arg):
         self.message = 'Insert "include Unimacro.vch" line in each Vocola Command File'
@@ -1681,16 +1838,15 @@ Vocola command.
         self.message = "Disabling Natlink:"
         self.config.disableNatlink()
 
-    def help_e(self):
-        print(('-'*60))
-        print(("""Enable Natlink (e) or disable Natlink (E):
+    # formatted with the Dragon name in __init__, as _HELP_E:
+    _HELP_E_TEMPLATE = """Enable Natlink (e) or disable Natlink (E):
 
 When you enable Natlink, the necessary settings in nssystem.ini and nsapps.ini
 are done.
 
 These options require elevated mode and probably Dragon be closed.
 
-After you restart %s, Natlink should start, opening a window titled
+After you restart {DNSName}, Natlink should start, opening a window titled
 'Messages from Natlink - ...'.
 
 When you enable Natlink, the file natlink.pyd is (re)registered silently.  Use
@@ -1700,14 +1856,16 @@ the commands r/R to register/unregister natlink.pyd explicitly.
 When you disable Natlink, the necessary settings in nssystem.ini and nsapps.ini
 are cleared.
 
-After you restart %s, Natlink should NOT START ANY MORE
+After you restart {DNSName}, Natlink should NOT START ANY MORE
 so the window 'Messages from Natlink' is NOT OPENED.
 
 Note: when you disable Natlink, the natlink.pyd file is NOT unregistered.
-It is not called any more by %s, as its declaration is removed from
+It is not called any more by {DNSName}, as its declaration is removed from
 the Global Clients section of nssystem.ini.
-"""% (self.DNSName, self.DNSName, self.DNSName)))
-        print(("="*60))
+"""
+
+    def help_e(self):
+        sys.stdout.write(self._HELP_E)
 
 
     help_E = help_e
@@ -1718,22 +1876,20 @@ the Global Clients section of nssystem.ini.
         if not arg:
             self.message = "do_v should have an argument"
             return
-        tryPath = self.config.isValidPath(arg)
-        if not tryPath:
-            self.message = "do_v, not a valid path: %s"% arg
-            return
         self.message =  'Set VocolaUserDirectory to "%s" and enable Vocola'% arg
         print(('do action: %s'% self.message))
-        self.config.setVocolaUserDirectory(arg)
+        # the setter checks the directory (~ allowed):
+        mess = self.config.setVocolaUserDirectory(arg)
+        if mess:
+            self.message = "do_v, %s"% mess
+            print(self.message)
 
     def do_V(self, arg):
         self.message = "Clear VocolaUserDirectory and (therefore) disable Vocola"
         print(('do action: %s'% self.message))
         self.config.clearVocolaUserDirectory()
 
-    def help_v(self):
-        print(('-'*60))
-        print("""Enable/disable Vocola by setting/clearing the VocolaUserDirectory
+    _HELP_V = _helpText("""Enable/disable Vocola by setting/clearing the VocolaUserDirectory
 (v <path>/V).
 
 In this VocolaUserDirectory your Vocola Command File are/will be located.
@@ -1743,7 +1899,9 @@ popular choice.
 
 You may have to manually create this folder first.
 """)
-        print(('='*60))
+
+    def help_v(self):
+        sys.stdout.write(self._HELP_V)
 
     help_V = help_v
 
@@ -1786,11 +1944,11 @@ You may have to manually create this folder first.
     def do_G(self, arg):
         print('no valid option')
 
-    def help_g(self):
-        print(('-'*60))
-        print("""not a valid option
+    _HELP_G = _helpText("""not a valid option
 """)
-        print(('='*60))
+
+    def help_g(self):
+        sys.stdout.write(self._HELP_G)
 
     help_G = help_g
     # enable/disable Natlink debug output...
@@ -1814,9 +1972,7 @@ You may have to manually create this folder first.
 
 
 
-    def help_x(self):
-        print(('-'*60))
-        print("""Enable (x)/disable (X) natlinkmain debug load output
+    _HELP_X = _helpText("""Enable (x)/disable (X) natlinkmain debug load output
 
 Enable (y)/disable (Y) natlinkmain debug callback output
 
@@ -1828,7 +1984,9 @@ This sends sometimes lengthy debugging messages to the
 Mainly used when you suspect problems with the working
 of Natlink, so keep off (X and Y) most of the time.
 """)
-        print(('='*60))
+
+    def help_x(self):
+        sys.stdout.write(self._HELP_X)
 
     help_y = help_x
     help_X = help_x
@@ -1837,8 +1995,7 @@ of Natlink, so keep off (X and Y) most of the time.
     # register natlink.pyd
     def do_r(self, arg):
         self.message = "(Re) register and enable natlink.pyd"
-        if not self.config.isElevated:
-            raise ElevationError(self.message)
+        self.requireElevation(self.message)
         print('do action: %s'% self.message)
         if not self.config.removeNatlinkPyd():
             return
@@ -1850,16 +2007,16 @@ of Natlink, so keep off (X and Y) most of the time.
         self.message = "Unregister natlink.pyd and disable Natlink"
         # if self.isNatSpeakRunning(): raise NatSpeakRunningError("Probably needed before you can unregister natlink.pyd")
 
-        if self.config.isElevated:
-            print(f'do action: {self.message}')
-            self.config.disableNatlink(silent=1)
-            self.config.unregisterNatlinkPyd(silent=None)
-        else:
-            raise ElevationError(self.message)
+        self.requireElevation(self.message)
+        print(f'do action: {self.message}')
+        self.config.disableNatlink(silent=1)
+        self.config.unregisterNatlinkPyd(silent=None)
 
     def do_z(self, arg):
         """register silent and enable Natlink"""
         # if self.isNatSpeakRunning(): raise NatSpeakRunningError("Probably needed before you can register natlink.pyd")
+        self.message = "(Silent) register natlink.pyd and enable Natlink"
+        self.requireElevation(self.message)
 
         if not self.config.removeNatlinkPyd():
             return
@@ -1869,12 +2026,12 @@ of Natlink, so keep off (X and Y) most of the time.
     def do_Z(self, arg):
         """(SILENT) Unregister natlink.pyd and disable Natlink"""
         # if self.isNatSpeakRunning(): raise NatSpeakRunningError("Probably needed before you can unregister natlink.pyd")
+        self.message = "(Silent) unregister natlink.pyd and disable Natlink"
+        self.requireElevation(self.message)
         self.config.disableNatlink(silent=1)
         self.config.unregisterNatlinkPyd(silent=1)
 
-    def help_r(self):
-        print(('-'*60))
-        print("""Registers (r) / unregisters (R) natlink.pyd explicitly.
+    _HELP_R = _helpText("""Registers (r) / unregisters (R) natlink.pyd explicitly.
 
 Registering is also done (silently) when you start this program or the
 configuration GUI the first time, so this option should only be needed in rare cases.
@@ -1895,7 +2052,9 @@ will be copied to this name and registered. In the log panel of the configure GU
 If you want to (silently) enable Natlink and register silently use -z,
 To disable Natlink and unregister (silently) use Z
 """)
-        print(('='*60))
+
+    def help_r(self):
+        sys.stdout.write(self._HELP_R)
     help_R = help_r
     help_z = help_r
     help_Z = help_r
@@ -1920,9 +2079,7 @@ To disable Natlink and unregister (silently) use Z
         print(('do action: %s'% self.message))
         self.config.disableVocolaTakesUnimacroActions()
 
-    def help_a(self):
-        print(('-'*60))
-        print("""----Enable (a)/disable (A) Vocola taking Unimacro actions.
+    _HELP_A = _helpText("""----Enable (a)/disable (A) Vocola taking Unimacro actions.
 
 These actions (Unimacro Shorthand Commands) and "meta actions" are processed by
 the Unimacro actions module.
@@ -1934,11 +2091,11 @@ The special option for that is (f).
 Note this option (f) is only needed when you use Vocola with Unimacro actions,
 but you do not use Unimacro.
 """)
-        print(('='*60))
 
-    def help_b(self):
-        print(('-'*60))
-        print("""----Enable (b)/disable (B) different Vocola User Directories
+    def help_a(self):
+        sys.stdout.write(self._HELP_A)
+
+    _HELP_B = _helpText("""----Enable (b)/disable (B) different Vocola User Directories
 
 If enabled, Vocola will look into a subdirectory "xxx" of
 VocolaUserDirectory IF the language code of the current user speech
@@ -1952,7 +2109,9 @@ is created, and all existing Vocola Command files for this Dutch speech profile
 
 When you use your English speech profile again, ("enx") the Vocola Command files in the VocolaUserDirectory are taken again.
 """)
-        print(('='*60))
+
+    def help_b(self):
+        sys.stdout.write(self._HELP_B)
 
     help_B = help_b
     help_A = help_a
@@ -1969,20 +2128,21 @@ When you use your English speech profile again, ("enx") the Vocola Command files
         self.config.clearAhkExeDir()
 
     def do_k(self, arg):
-        arg = self.stripCheckDirectory(arg)  # also quotes
+        arg = self.stripQuotes(arg)
         if not arg:
             return
         self.message = 'set user directory for AutoHotkey scripts to: %s'% arg
-        self.config.setAhkUserDir(arg)
+        # the setter checks the directory:
+        mess = self.config.setAhkUserDir(arg)
+        if mess:
+            print(mess)
 
     def do_K(self, arg):
         self.message = 'clear user directory of AutoHotkey scripts, return to default'
         print(('do action: %s'% self.message))
         self.config.clearAhkUserDir()
 
-    def help_h(self):
-        print(('-'*60))
-        print("""----Set (h)/clear (return to default) (H) the AutoHotkey exe directory.
+    _HELP_H = _helpText("""----Set (h)/clear (return to default) (H) the AutoHotkey exe directory.
        Assume autohotkey.exe is found there (if not AutoHotkey support will not be there)
        If set to a invalid directory, AutoHotkey support will be switched off.
 
@@ -1990,7 +2150,9 @@ When you use your English speech profile again, ("enx") the Vocola Command files
 
        Note: currently these options can only be run from the natlinkconfigfunctions.py script.
 """)
-        print(('='*60))
+
+    def help_h(self):
+        sys.stdout.write(self._HELP_H)
 
     help_H = help_k = help_K = help_h
 
@@ -2006,15 +2168,26 @@ When you use your English speech profile again, ("enx") the Vocola Command files
     def do_usage(self, arg):
         self.usage()
     do_u = do_usage
-    def help_u(self):
-        print(('-'*60))
-        print("""u and usage give the list of commands
+    # (no closing separator line here)
+    _HELP_U = separatorDash + '\n' + """u and usage give the list of commands
 lowercase commands usually set/enable something
 uppercase commands usually clear/disable something
 Informational commands: i and I
-""")
+""" + '\n'
+
+    def help_u(self):
+        sys.stdout.write(self._HELP_U)
     help_usage = help_u
 
+# command line options of _main, the ones with ":" take an argument:
+_SHORT_OPTIONS = "aAiIeEfFgGyYxXDCVbBNOPlmMrRzZuq"
+_SHORT_ARG_OPTIONS = "d:c:v:n:o:p:"
+
+# option -> (CLI method name, takes argument), only options with a do_ method:
+_OPTION_METHODS = {o: ('do_'+o, o in _SHORT_ARG_OPTIONS)
+                   for o in (_SHORT_OPTIONS+_SHORT_ARG_OPTIONS).replace(':', '')
+                   if hasattr(CLI, 'do_'+o)}
+
 def getFileDate(modName):
     """getting mod date/time of file, 0 if non existing
     """
@@ -2033,13 +2206,13 @@ def main():
             cli.cmdloop()
         except (KeyboardInterrupt, SystemExit):
             pass
-        except ElevationError:
-            e = sys.exc_info()[1]
+        except ElevationError as e:
             print(f'For some functions you need to run this program in elevated mode\n-- {e.message}')
             cli.do_q("dummy")
-        except NatSpeakRunningError:
-            e = sys.exc_info()[1]
+        except NatSpeakRunningError as e:
             print(f'Dragon should not be running for the function you choosed\n-- {e.message}')
+        finally:
+            cli.config.closeRegistryKeys()
     else:
         _main()
 
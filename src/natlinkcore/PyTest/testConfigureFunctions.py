@@ -247,6 +247,57 @@ class TestConfigureFunctions(unittest.TestCase):
         expected = ['k1=v1']
         self.assertTrue(expected == section, "section |%s| after deleted keys is not as expected: |%s|"% (section, expected))
         
+    def countInifileWrites(self):
+        """let testinisection record each write of natlinkstatustest.ini in the returned list
+        """
+        ini = self.testinisection.ini
+        writes = []
+        realWrite = ini.write
+        def write(file=None):
+            writes.append(file)
+            realWrite(file=file)
+        ini.write = write
+        return writes
+
+    def test_inifileSectionBatch(self):
+        """set and delete inside (nested) batch blocks write the inifile once, at the end
+        """
+        section = self.testinisection
+        writes = self.countInifileWrites()
+        with section.batch():
+            section.set('batchkey1', 'value1')
+            with section.batch():
+                section.set('batchkey2', 'value2')
+                section.delete('batchkey1')
+            self.assertEqual([], writes, "inner batch block should not write the inifile")
+            self.assertEqual('value2', section.get('batchkey2'), "value should be there before the inifile is written")
+            self.assertFalse('batchkey1' in section, "deleted key should be gone before the inifile is written")
+        self.assertEqual(1, len(writes), "outer batch block should write the inifile once, not: %s"% len(writes))
+
+        fresh = NatlinkstatusTestInifileSection()
+        self.assertEqual('value2', fresh.get('batchkey2'), "key set in the batch should be in the inifile")
+        self.assertFalse('batchkey1' in fresh, "key deleted in the batch should not be in the inifile")
+
+    def test_inifileSectionNoChangeNoWrite(self):
+        """setting the same value again, or deleting a missing key, does not write the inifile
+        
+        setting an empty value deletes the key, and is written
+        """
+        section = self.testinisection
+        section.set('samekey', 'value')
+        writes = self.countInifileWrites()
+        section.set('samekey', 'value')
+        section.delete('notthere')
+        with section.batch():
+            section.set('samekey', 'value')
+            section.delete('notthere')
+        self.assertEqual([], writes, "nothing changed, the inifile should not be written")
+
+        section.set('samekey', '')
+        self.assertEqual(1, len(writes), "setting an empty value should write the inifile once, not: %s"% len(writes))
+        fresh = NatlinkstatusTestInifileSection()
+        self.assertFalse('samekey' in fresh, "key set to an empty value should not be in the inifile")
+
     def test_getExtendedEnv(self):
         """Test the different functions in natlinkcorefunctions that do environment variables
 
@@ -488,6 +539,98 @@ class TestConfigureFunctions(unittest.TestCase):
         self.checkusertestinifile(key, wordpadExe, "UnimacroIniFilesEditor, should again be set now to: %s"% wordpadExe)
         self.checkusertestinifile(oldKey, "", "OldUnimacroIniFilesEditor, should be cleared again")
     
+    def test_setClearDNSIniDir(self):
+        """This option should set or clear the directory of nssystem.ini and nsapps.ini
+        
+        clearing keeps a valid previous value in OldDNSIniDir, an invalid one is dropped
+        """
+        key = "DNSIniDir"
+        oldKey = "Old" + key
+        cli = self.cli
+        # clearing when not set changes nothing:
+        cli.do_C("dummy")
+        self.checkusertestinifile(key, "", "DNSIniDir, should not be there")
+        self.checkusertestinifile(oldKey, "", "OldDNSIniDir, should not be there")
+
+        iniDir = os.path.join(self.tmpTest, 'dnsinidir')
+        os.mkdir(iniDir)
+        for iniFile in ('nssystem.ini', 'nsapps.ini'):
+            with open(os.path.join(iniDir, iniFile), 'w'):
+                pass
+        cli.do_c(iniDir)
+        self.checkusertestinifile(key, iniDir, "DNSIniDir, should be set now to: %s"% iniDir)
+
+        cli.do_C("dummy")
+        self.checkusertestinifile(key, "", "DNSIniDir, should be cleared now")
+        self.checkusertestinifile(oldKey, iniDir, "OldDNSIniDir, should be set now to: %s"% iniDir)
+
+        # setting again removes the Old key:
+        cli.do_c(iniDir)
+        self.checkusertestinifile(key, iniDir, "DNSIniDir, should be set again to: %s"% iniDir)
+        self.checkusertestinifile(oldKey, "", "OldDNSIniDir, should be cleared again")
+
+        # an invalid previous value is not kept:
+        shutil.rmtree(iniDir)
+        cli.do_C("dummy")
+        self.checkusertestinifile(key, "", "DNSIniDir, should be cleared now")
+        self.checkusertestinifile(oldKey, "", "OldDNSIniDir, should not be set for a folder that is gone")
+
+    def test_emptyDirectoryArgument(self):
+        """an empty or missing directory is not valid, and does not list the current directory
+        """
+        key = "DNSIniDir"
+        config = self.cli.config
+        # the current directory holds the INI files, an empty argument should not find them:
+        curDir = os.getcwd()
+        try:
+            os.chdir(self.tmpTest)
+            for iniFile in ('nssystem.ini', 'nsapps.ini'):
+                with open(iniFile, 'w'):
+                    pass
+            for emptyDir in ('', None):
+                self.assertEqual(set(), natlinkconfigfunctions.scanFileNames(emptyDir),
+                                 "scanFileNames should return an empty set for: %s"% repr(emptyDir))
+                mess = config.setDNSIniDir(emptyDir)
+                self.assertTrue(mess, "setDNSIniDir should return a message for: %s"% repr(emptyDir))
+                self.checkusertestinifile(key, "", "DNSIniDir, should not be set for: %s"% repr(emptyDir))
+        finally:
+            os.chdir(curDir)
+
+    def test_setClearAhkUserDir(self):
+        """This option should set or clear the User Directory for AutoHotkey scripts
+        
+        clearing keeps a valid previous value in OldAhkUserDir, an invalid one is dropped
+        """
+        key = "AhkUserDir"
+        oldKey = "Old" + key
+        cli = self.cli
+        config = cli.config
+        # clearing when not set changes nothing:
+        mess = config.clearAhkUserDir()
+        self.assertTrue(mess, "clearAhkUserDir, should return a message if AhkUserDir was not set")
+        self.checkusertestinifile(key, "", "AhkUserDir, should not be there")
+        self.checkusertestinifile(oldKey, "", "OldAhkUserDir, should not be there")
+
+        ahkDir = os.path.join(self.tmpTest, 'ahkuserdir')
+        os.mkdir(ahkDir)
+        cli.do_k(ahkDir)
+        self.checkusertestinifile(key, ahkDir, "AhkUserDir, should be set now to: %s"% ahkDir)
+
+        cli.do_K("dummy")
+        self.checkusertestinifile(key, "", "AhkUserDir, should be cleared now")
+        self.checkusertestinifile(oldKey, ahkDir, "OldAhkUserDir, should be set now to: %s"% ahkDir)
+
+        # setting again removes the Old key:
+        cli.do_k(ahkDir)
+        self.checkusertestinifile(key, ahkDir, "AhkUserDir, should be set again to: %s"% ahkDir)
+        self.checkusertestinifile(oldKey, "", "OldAhkUserDir, should be cleared again")
+
+        # an invalid previous value is not kept:
+        shutil.rmtree(ahkDir)
+        cli.do_K("dummy")
+        self.checkusertestinifile(key, "", "AhkUserDir, should be cleared now")
+        self.checkusertestinifile(oldKey, "", "OldAhkUserDir, should not be set for a folder that is gone")
+
     def test_setClearDirectoryOptions(self):
         r"""This option tests the different directory functions of natlinkconfigfunctions
         
@@ -605,6 +748,49 @@ class TestConfigureFunctions(unittest.TestCase):
         cli.do_V("dummy")
         self.checkusertestinifile(key, None, "%s VocolaUserDirectory should be cleared now"% testName)
         
+    def test_includeRemoveUnimacroVchLine(self):
+        r"""m and M insert and remove the include line of Unimacro.vch in the Vocola command files
+        
+        root files include Unimacro.vch, files in a language subfolder ..\Unimacro.vch,
+        other includes of Unimacro.vch or usc.vch (any case, / or \) are replaced or removed.
+        Other subfolders are not touched.
+        """
+        cli = self.cli
+        vocDir = os.path.join(self.tmpTest, 'vocolatest')
+        files = {
+            '_test.vcl': "# root\ninclude usc.vch;\nCommand 1 = {Enter};\n",
+            os.path.join('nld', '_test.vcl'): "INCLUDE Unimacro.vch;\n# nld\ninclude ../usc.vch;\n"
+                                              "include other.vch;\nCommando = {Enter};\n",
+            os.path.join('other', '_test.vcl'): "include Unimacro.vch;\n"}
+        for name, text in files.items():
+            F = os.path.join(vocDir, name)
+            os.makedirs(os.path.dirname(F), exist_ok=True)
+            with open(F, 'w') as fp:
+                fp.write(text)
+        cli.do_v(vocDir)
+
+        def checkFiles(expected, mess):
+            for name, text in expected.items():
+                with open(os.path.join(vocDir, name), 'r') as fp:
+                    actual = fp.read()
+                self.assertEqual(text, actual, "%s, file %s"% (mess, name))
+
+        included = {
+            '_test.vcl': "include Unimacro.vch;\n# root\nCommand 1 = {Enter};\n",
+            os.path.join('nld', '_test.vcl'): "include ..\\Unimacro.vch;\n# nld\ninclude other.vch;\nCommando = {Enter};\n",
+            os.path.join('other', '_test.vcl'): files[os.path.join('other', '_test.vcl')]}
+        cli.do_m("dummy")
+        checkFiles(included, "after including Unimacro.vch")
+        cli.do_m("dummy")
+        checkFiles(included, "including Unimacro.vch again should change nothing")
+
+        removed = {
+            '_test.vcl': "# root\nCommand 1 = {Enter};\n",
+            os.path.join('nld', '_test.vcl'): "# nld\ninclude other.vch;\nCommando = {Enter};\n",
+            os.path.join('other', '_test.vcl'): files[os.path.join('other', '_test.vcl')]}
+        cli.do_M("dummy")
+        checkFiles(removed, "after removing the include of Unimacro.vch")
+
     # def test_setClearVocolaCommandFilesEditor(self):
     #     """This option should set or clear the vocola command files editor
     #     """
@@ -31,6 +31,7 @@ Note: for extension with %NATLINK% etc. see natlinkstatus.py
 """
 import os
 import re
+from contextlib import contextmanager
 from win32com.shell import shell, shellcon
 from natlinkcore import inivars
 import natlinkcore   ## for __init__ and getNatlinkUserdirectory
@@ -430,6 +431,12 @@ class InifileSection:
                  if value = "0" or "1" the integer value 0 or 1 is returned
         delete(key): deletes from section
         keys(): return a list of keys in the section
+        key in section: test if key is present in the section
+        batch(): context manager, set and delete inside the block
+                 are written to the inifile only once, at the end
+        flush(): write pending changes to the inifile
+        
+        values got are kept in a dict, set and delete clear it.
         __repr__: give contents of a section
         
     """
@@ -439,6 +446,8 @@ class InifileSection:
         """
         self.section = section
         self.ini = inivars.IniVars(filepath) # want strings to be returned
+        self._deferred = 0
+        self._cache = {}
           
     def __repr__(self):
         """return contents of sections
@@ -452,16 +461,22 @@ class InifileSection:
     def __iter__(self):
         for item in self.ini.get(self.section):
             yield item         
+
+    def __contains__(self, key):
+        """test for key directly, without building the list of keys
+        """
+        return self.ini.hasKey(self.section, key)
             
     def get(self, key, defaultValue=None):
         """get an item from a key
         
         """
-        if defaultValue is None:
-            defaultValue = ''
-        else:
-            defaultValue = str(defaultValue)
-        value = self.ini.get(self.section, key, defaultValue)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self.ini.get(self.section, key, None)
+        if value is None:
+            value = '' if defaultValue is None else str(defaultValue)
 
         # value = win32api.GetProfileVal(self.section, key, defaultValue, self.filename)
 ##        if value:
@@ -477,13 +492,15 @@ class InifileSection:
         
         """
 ##        print 'set: %s, %s: %s'% (self.section, key, value)
+        self._cache.clear()
         if value in [0, "0"]:
             self.delete(key)
         elif not value:
             self.ini.delete(self.section, key)
+            self._write()
         else:
             self.ini.set(self.section, key, value)
-            self.ini.write()
+            self._write()
             # win32api.WriteProfileVal( self.section, key, str(value), self.filename)
             # checkValue = win32api.GetProfileVal(self.section, key, 'nonsens', self.filename)
             # if not (checkValue == value or \
@@ -494,8 +511,9 @@ class InifileSection:
         """delete an item for a key (really set to "")
         
         """
+        self._cache.clear()
         self.ini.delete(self.section, key)
-        self.ini.write()
+        self._write()
         # print 'delete: %s, %s'% (self.section, key)
         # value = win32api.WriteProfileVal( self.section, key, None,
         #                                self.filename)
@@ -510,6 +528,31 @@ class InifileSection:
         # #print 'return Keys: %s'% Keys
         return Keys
 
+    @contextmanager
+    def batch(self):
+        """collect set and delete calls, and write the inifile once at the end
+        
+        can be nested, only the outermost block writes.
+        """
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if not self._deferred:
+                self.flush()
+
+    def flush(self):
+        """write the inifile, if there are changes
+        """
+        self.ini.writeIfChanged()
+
+    def _write(self):
+        """write now, or at the end of the batch
+        """
+        if not self._deferred:
+            self.flush()
+
 defaultFilename = "natlinkstatus.ini"
 defaultSection = 'usersettings'
 class NatlinkstatusInifileSection(InifileSection):
@@ -10,7 +10,6 @@ If you know how to add support for another debugger please add it.
 """
 #pylint:disable=C0116, W0603, W0703, W0702
 import os
-import debugpy
 from natlinkcore import natlinkstatus
 
 
@@ -25,9 +24,22 @@ __debugpy_debug_port=default_debugpy_port
 __debugger="not configured"
 dap="DAP"
 
+#these do not change while Natlink runs, so look them up once
+_NATLINK_DIR = __status.getNatlinkDirectory()
+_DEBUG_INSTRUCTIONS = f"{_NATLINK_DIR}\\debugging python instructions.docx"
+_CONFIGURED_PORT_STRING = os.environ.get(__natLinkPythonDebugPortEnvironmentVar)
+try:
+    _CONFIGURED_PORT = int(_CONFIGURED_PORT_STRING)
+except (TypeError, ValueError):
+    _CONFIGURED_PORT = None
+
 #bring a couple functions from DAP and export from our namespace
-dap_is_client_connected=debugpy.is_client_connected
-dap_breakpoint = debugpy.breakpoint
+#debugpy is only imported by start_dap, which replaces these stand-ins by the debugpy functions
+def dap_is_client_connected():
+    return False
+
+def dap_breakpoint():
+    pass
 
 def dap_info():
     return f"""
@@ -36,18 +48,24 @@ Debug Started:{__debug_started}
 """
 
 def start_dap():
-    global  __debug_started,__debugpy_debug_port,__debugger
+    global  __debug_started,__debugpy_debug_port,__debugger,dap_is_client_connected,dap_breakpoint
     if __debug_started:
         print(f"DAP already started with debugpy for port {__debugpy_debug_port}")
         return
-    if __natLinkPythonDebugPortEnvironmentVar in os.environ:
-        natLinkPythonPortStringVal = os.environ[__natLinkPythonDebugPortEnvironmentVar] or None
-        try:
-            __debugpy_debug_port = int(natLinkPythonPortStringVal)
-        except:
-            print(f'failed to take port number from environment variable "NatlinkPyDebugPort", take default "{__debugpy_debug_port}"')
+    if _CONFIGURED_PORT is not None:
+        __debugpy_debug_port = _CONFIGURED_PORT
+    elif _CONFIGURED_PORT_STRING is not None:
+        print(f'failed to take port number from environment variable "NatlinkPyDebugPort", take default "{__debugpy_debug_port}"')
 
 
+    try:
+        import debugpy
+    except ImportError as exc:
+        print(f"Cannot start debugging, debugpy is not available: {exc}")
+        return
+    dap_is_client_connected = debugpy.is_client_connected
+    dap_breakpoint = debugpy.breakpoint
+
     try:
 
         print(f"Starting debugpy on port {__debugpy_debug_port}")
@@ -76,9 +94,8 @@ def start_dap():
 
 def debug_check_on_startup():
     global  __debug_started,__debugpy_debug_port,__debugger
-    debug_instructions = f"{__status.getNatlinkDirectory()}\\debugging python instructions.docx"
-    print(f"Instructions for attaching a python debugger are in {debug_instructions} ")
-    if __natLinkPythonDebugPortEnvironmentVar in os.environ:
+    print(f"Instructions for attaching a python debugger are in {_DEBUG_INSTRUCTIONS} ")
+    if _CONFIGURED_PORT_STRING is not None:
         start_dap()
 
 
@@ -209,6 +209,9 @@ shiftKeyDict = {"nld": "Shift",
                 "esp": "may\xfas"}
 
 reportDNSIniDirErrors = True # set after one stroke to False, if errors were there (2017, february)
+# separator lines of warnings and help texts (also used by natlinkconfigfunctions):
+separatorDash = '-'*60
+separatorEq = '='*60
 
 
 class NatlinkStatus:
@@ -252,6 +255,8 @@ class NatlinkStatus:
     UnimacroDirectory = None
     UnimacroUserDirectory = None
     UnimacroGrammarsDirectory = None
+    # results of findInSitePackages, cloneDir -> directory, shared by all instances:
+    _sitePackagesDirs = {}
     ## Vocola:
     VocolaUserDirectory = None
     VocolaDirectory = None
@@ -982,7 +987,7 @@ class NatlinkStatus:
             if self.checkDNSProgramDir(P):
                 return P
             if not self.skipSpecialWarning:
-                print('-'*60)
+                print(separatorDash)
                 print('DNSInstallDir is set in natlinkstatus.ini to "%s", ...'% P)
                 print('... this does not match a valid Dragon Program Directory.')
                 print('This directory should hold a Program subdirectory or')
@@ -992,7 +997,7 @@ class NatlinkStatus:
                 print('Please set or clear DNSInstallDir:')
                 print('In Config GUI, with button in the info panel, or')
                 print('Via natlinkconfigfunctions.py with option d')
-                print('-'*60)
+                print(separatorDash)
                 raise OSError('Invalid value of DNSInstallDir: %s'% P)
             print('invalid DNSInstallDir: %s, but proceed...'% P)
             return ''
@@ -1013,15 +1018,15 @@ class NatlinkStatus:
                     # return a str:
                     return cand.normpath()
         if not self.skipSpecialWarning:
-            print('-'*60)
+            print(separatorDash)
             print('No valid DNSInstallDir is found in the default settings of Natlink')
             print()
             print('Please exit Dragon and set a valid DNSInstallDir:')
             print('In Config GUI, with button in the info panel, or')
             print('Via natlinkconfigfunctions.py with option d')
-            print('-'*60)
+            print(separatorDash)
             raise OSError('No valid DNSInstallDir found in the default settings of Natlink')
-        print('-'*60)
+        print(separatorDash)
         print('No valid DNSInstallDir is found in the default settings of Natlink.')
         print()
         print('Please specify a valid DNSInstallDir:')
@@ -1435,9 +1440,20 @@ class NatlinkStatus:
         
         If not found, return the input directory (cloneDir)
         
+        The result is kept per cloneDir, sys.prefix and the site-packages do not change in a session.
         """
-        #pylint:disable=R0201
         cloneDir = str(cloneDir)
+        try:
+            return self._sitePackagesDirs[cloneDir]
+        except KeyError:
+            pass
+        result = self._sitePackagesDirs[cloneDir] = self._findInSitePackages(cloneDir)
+        return result
+
+    def _findInSitePackages(self, cloneDir):
+        """do the work for findInSitePackages, cloneDir is a str
+        """
+        #pylint:disable=R0201
         if cloneDir.find('\\src\\') < 0:
             return cloneDir
             # raise IOErrorprint(f'This function should only be called when "\\src\\" is in the path')